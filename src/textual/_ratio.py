@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import Sequence, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .layouts.dock import DockOptions
+
+
+def ratio_resolve(total: int, options: Sequence[DockOptions]) -> list[int]:
+    """Divide total space to satisfy size, fraction, and minimum_size constraints.
+
+    A specialization of rich._ratio.ratio_resolve for DockOptions. Since dock
+    sizes are all integers, the ratio portion may be tracked as an integer
+    numerator over a shared denominator, which keeps the layout hot loop free
+    of Fraction arithmetic and generic attribute access.
+
+    The returned list of integers should add up to total in most cases, unless
+    it is impossible to satisfy all the constraints.
+
+    Args:
+        total (int): Total number of characters.
+        options (Sequence[DockOptions]): Options for each dockable widget.
+
+    Returns:
+        list[int]: Number of characters for each widget.
+    """
+    # Size of widget or None for yet to be determined
+    sizes = [(option.size or None) for option in options]
+
+    # While any sizes haven't been calculated
+    while None in sizes:
+        # Get flexible options and index to map these back on to sizes list
+        flexible_options = [
+            (index, option)
+            for index, (size, option) in enumerate(zip(sizes, options))
+            if size is None
+        ]
+        # Remaining space in total
+        remaining = total - sum(size or 0 for size in sizes)
+        if remaining <= 0:
+            # No room for flexible widgets
+            return [
+                ((option.minimum_size or 1) if size is None else size)
+                for size, option in zip(sizes, options)
+            ]
+        # The ratio portion is remaining / total_fraction
+        total_fraction = sum((option.fraction or 1) for _, option in flexible_options)
+
+        # If any widgets will be less than their minimum, replace size with the minimum
+        for index, option in flexible_options:
+            if remaining * option.fraction <= option.minimum_size * total_fraction:
+                sizes[index] = option.minimum_size
+                # New fixed size will invalidate calculations, so we need to repeat the process
+                break
+        else:
+            # Distribute flexible space and compensate for rounding error
+            # Since sizes can only be integers we need to add the remainder
+            # to the following line
+            remainder = 0
+            for index, option in flexible_options:
+                size, remainder = divmod(
+                    remaining * option.fraction + remainder, total_fraction
+                )
+                sizes[index] = size
+            break
+    # Sizes now contains integers only
+    return sizes
@@ -4,7 +4,9 @@ import os
 import asyncio
 
 import logging
+import re
 import signal
+import sys
 from typing import Any, ClassVar, Type, TypeVar
 import warnings
 
@@ -24,6 +26,7 @@ from .keys import Binding
 from .driver import Driver
 from .layouts.dock import DockLayout, Dock, DockEdge, DockOptions
 from ._linux_driver import LinuxDriver
+from ._types import MessageHandler
 from .message_pump import MessagePump
 from .message import Message
 from .view import DockView, View
@@ -33,7 +36,10 @@ log = logging.getLogger("rich")
 
 
 # asyncio will warn against resources not being cleared
-warnings.simplefilter("always", ResourceWarning)
+# The "always" filter defeats CPython's duplicate-warning suppression, so
+# only pay for it when debugging
+if os.environ.get("TEXTUAL_DEBUG"):
+    warnings.simplefilter("always", ResourceWarning)
 # https://github.com/boto/boto3/issues/454
 # warnings.filterwarnings(
 #     "ignore", category=ResourceWarning, message="unclosed.*<ssl.SSLSocket.*>"
@@ -42,6 +48,21 @@ warnings.simplefilter("always", ResourceWarning)
 
 LayoutDefinition = "dict[str, Any]"
 
+_HOME = Control.home()
+
+# DCS sequences marking the start and end of a synchronized update
+_SYNC_START = "\x1bP=1s\x1b\\"
+_SYNC_END = "\x1bP=2s\x1b\\"
+
+_re_sgr_run = re.compile(r"(?:\x1b\[[0-9;]*m){2,}")
+_re_sgr_params = re.compile(r"\x1b\[([0-9;]*)m")
+
+
+def _fuse_sgr(match: "re.Match[str]") -> str:
+    """Fuse a run of adjacent SGR escape sequences in to a single sequence."""
+    params = _re_sgr_params.findall(match.group())
+    return "\x1b[" + ";".join(param or "0" for param in params) + "m"
+
 ViewType = TypeVar("ViewType", bound=View)
 
 # try:
@@ -79,14 +100,31 @@ class App(MessagePump):
         self.title = title
         self._layout = DockLayout()
         self._view_stack: list[View] = [View()]
-        self.children: set[MessagePump] = set()
+        self.children: list[MessagePump] = []
 
         self.focused: Widget | None = None
         self.mouse_over: Widget | None = None
         self.mouse_captured: Widget | None = None
         self._driver: Driver | None = None
+        self._sync_available = os.environ.get("TERM_PROGRAM", "") != "Apple_Terminal"
+        self._write_queue: asyncio.Queue[str | None] | None = None
+        self._writer_task: asyncio.Task | None = None
+
+        # App renders as the current view, so this may be reused across frames
+        self._screen_renderable = Screen(_HOME, self, _HOME)
 
         self._bindings: dict[str, Binding] = {}
+        # Warm the dispatch table with the hot input types, so the first
+        # event of each type doesn't pay for handler resolution
+        forward_input = self._forward_input_event
+        self._event_dispatch: dict[type[events.Event], MessageHandler] = {
+            events.Key: self._on_key_event,
+            events.MouseMove: forward_input,
+            events.MouseDown: forward_input,
+            events.MouseUp: forward_input,
+            events.MouseScrollDown: forward_input,
+            events.MouseScrollUp: forward_input,
+        }
         self._docks: list[Dock] = []
         self._action_targets = {"app", "view"}
         self._animator = Animator(self)
@@ -113,7 +151,8 @@ class App(MessagePump):
     async def bind(self, keys: str, action: str, description: str = "") -> None:
         all_keys = [key.strip() for key in keys.split(",")]
         for key in all_keys:
-            self._bindings[key] = Binding(action, description)
+            # Interned keys enable the dict lookup fast path in on_event
+            self._bindings[sys.intern(key)] = Binding(action, description)
 
     @classmethod
     def run(
@@ -143,7 +182,8 @@ class App(MessagePump):
     def on_keyboard_interupt(self) -> None:
         loop = asyncio.get_event_loop()
         event = events.ShutdownRequest(sender=self)
-        asyncio.run_coroutine_threadsafe(self.post_message(event), loop=loop)
+        # post_message_no_wait is a plain callable, so no Task is required
+        loop.call_soon_threadsafe(self.post_message_no_wait, event)
 
     async def set_focus(self, widget: Widget | None) -> None:
         log.debug("set_focus %r", widget)
@@ -156,10 +196,16 @@ class App(MessagePump):
                 self.focused = None
                 await focused.post_message(events.Blur(self))
         elif widget.can_focus:
-            if self.focused is not None:
-                await self.focused.post_message(events.Blur(self))
-            if widget is not None and self.focused != widget:
-                self.focused = widget
+            focused = self.focused
+            self.focused = widget
+            if focused is not None:
+                # Blur and Focus go to different widgets, so they may be
+                # posted concurrently
+                await asyncio.gather(
+                    focused.post_message(events.Blur(self)),
+                    widget.post_message(events.Focus(self)),
+                )
+            else:
                 await widget.post_message(events.Focus(self))
 
     async def set_mouse_over(self, widget: Widget | None) -> None:
@@ -171,10 +217,14 @@ class App(MessagePump):
                     self.mouse_over = None
         else:
             if self.mouse_over != widget:
+                mouse_over = self.mouse_over
                 try:
-                    if self.mouse_over is not None:
-                        await self.mouse_over.forward_event(events.Leave(self))
-                    if widget is not None:
+                    if mouse_over is not None:
+                        await asyncio.gather(
+                            mouse_over.forward_event(events.Leave(self)),
+                            widget.forward_event(events.Enter(self)),
+                        )
+                    else:
                         await widget.forward_event(events.Enter(self))
                 finally:
                     self.mouse_over = widget
@@ -204,6 +254,8 @@ class App(MessagePump):
             log.exception("error starting application mode")
         else:
             traceback: Traceback | None = None
+            self._write_queue = asyncio.Queue()
+            self._writer_task = asyncio.create_task(self._write_frames())
             await self.animator.start()
             try:
                 await super().process_messages()
@@ -212,6 +264,7 @@ class App(MessagePump):
 
             await self.animator.stop()
             await self.view.close_messages()
+            await self._close_writer()
             driver.stop_application_mode()
             if traceback is not None:
                 self.console.print(traceback)
@@ -226,12 +279,16 @@ class App(MessagePump):
         self.refresh()
 
     async def register(self, child: MessagePump) -> None:
-        self.children.add(child)
+        if child not in self.children:
+            self.children.append(child)
         child.start_messages()
         await child.post_message(events.Created(sender=self))
 
     async def remove(self, child: MessagePump) -> None:
-        self.children.remove(child)
+        try:
+            self.children.remove(child)
+        except ValueError:
+            pass
 
     async def shutdown(self):
         driver = self._driver
@@ -239,16 +296,15 @@ class App(MessagePump):
         await self.close_messages()
 
     def refresh(self) -> None:
-        sync_available = os.environ.get("TERM_PROGRAM", "") != "Apple_Terminal"
         if not self._closed:
             console = self.console
             try:
-                if sync_available:
-                    console.file.write("\x1bP=1s\x1b\\")
-                with console:
-                    console.print(Screen(Control.home(), self.view, Control.home()))
-                if sync_available:
-                    console.file.write("\x1bP=2s\x1b\\")
+                with console.capture() as capture:
+                    console.print(self._screen_renderable)
+                frame = _re_sgr_run.sub(_fuse_sgr, capture.get())
+                if self._sync_available:
+                    frame = f"{_SYNC_START}{frame}{_SYNC_END}"
+                self._display(frame)
             except Exception:
                 log.exception("refresh failed")
 
@@ -256,27 +312,76 @@ class App(MessagePump):
         if not self._closed:
             console = self.console
             try:
-                with console:
+                with console.capture() as capture:
                     console.print(renderable)
+                self._display(capture.get())
             except Exception:
                 log.exception("display failed")
 
+    def _display(self, text: str) -> None:
+        """Write to the terminal, via the writer task when it is running."""
+        if self._write_queue is not None:
+            self._write_queue.put_nowait(text)
+        else:
+            console = self.console
+            console.file.write(text)
+            console.file.flush()
+
+    async def _write_frames(self) -> None:
+        """Write queued frames in a thread, so large writes don't block the event loop."""
+        loop = asyncio.get_event_loop()
+        console = self.console
+        write_queue = self._write_queue
+        assert write_queue is not None
+
+        def write(text: str) -> None:
+            console.file.write(text)
+            console.file.flush()
+
+        while True:
+            text = await write_queue.get()
+            if text is None:
+                break
+            await loop.run_in_executor(None, write, text)
+
+    async def _close_writer(self) -> None:
+        """Flush remaining writes and stop the writer task."""
+        write_queue = self._write_queue
+        if write_queue is not None:
+            await write_queue.put(None)
+            if self._writer_task is not None:
+                await self._writer_task
+                self._writer_task = None
+            self._write_queue = None
+
     def get_widget_at(self, x: int, y: int) -> tuple[Widget, Region]:
         return self.view.get_widget_at(x, y)
 
+    async def _on_key_event(self, event: events.Key) -> None:
+        binding = self._bindings.get(event.key, None)
+        if binding is not None:
+            await self.action(binding.action)
+            return
+        if self.focused is not None:
+            await self.focused.forward_event(event)
+        await self.view.forward_event(event)
+
+    async def _forward_input_event(self, event: events.InputEvent) -> None:
+        await self.view.forward_event(event)
+
     async def on_event(self, event: events.Event) -> None:
-        if isinstance(event, events.Key):
-            binding = self._bindings.get(event.key, None)
-            if binding is not None:
-                await self.action(binding.action)
-                return
-
-        if isinstance(event, events.InputEvent):
-            if isinstance(event, events.Key) and self.focused is not None:
-                await self.focused.forward_event(event)
-            await self.view.forward_event(event)
-        else:
-            await super().on_event(event)
+        handler = self._event_dispatch.get(type(event))
+        if handler is None:
+            # Resolve the handler once per event type and memoize it
+            event_type = type(event)
+            if issubclass(event_type, events.Key):
+                handler = self._on_key_event
+            elif issubclass(event_type, events.InputEvent):
+                handler = self._forward_input_event
+            else:
+                handler = super().on_event
+            self._event_dispatch[event_type] = handler
+        await handler(event)
 
     async def action(
         self, action: str, default_namespace: object | None = None
@@ -317,21 +422,6 @@ class App(MessagePump):
     async def on_resize(self, event: events.Resize) -> None:
         await self.view.post_message(event)
 
-    async def on_mouse_move(self, event: events.MouseMove) -> None:
-        await self.view.post_message(event)
-
-    async def on_mouse_down(self, event: events.MouseDown) -> None:
-        await self.view.post_message(event)
-
-    async def on_mouse_up(self, event: events.MouseUp) -> None:
-        await self.view.post_message(event)
-
-    async def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
-        await self.view.post_message(event)
-
-    async def on_mouse_scroll_down(self, event: events.MouseScrollUp) -> None:
-        await self.view.post_message(event)
-
     async def action_quit(self) -> None:
         await self.shutdown()
 
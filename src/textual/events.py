@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from rich.repr import rich_repr, RichReprResult
@@ -109,7 +110,7 @@ class Key(InputEvent, bubble=True):
 
     def __init__(self, sender: MessageTarget, key: Keys | str) -> None:
         super().__init__(sender)
-        self.key = key.value if isinstance(key, Keys) else key
+        self.key = sys.intern(key.value if isinstance(key, Keys) else key)
 
     def __rich_repr__(self) -> RichReprResult:
         yield "key", self.key
@@ -177,7 +178,9 @@ class MouseEvent(InputEvent):
 
 @rich_repr
 class MouseMove(MouseEvent):
-    pass
+    def can_batch(self, message: Message) -> bool:
+        # Only the most recent pointer position matters; coalesce bursts
+        return isinstance(message, MouseMove)
 
 
 @rich_repr
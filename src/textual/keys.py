@@ -1,5 +1,5 @@
-from dataclasses import dataclass
 from enum import Enum
+from typing import NamedTuple
 
 # Adapted from prompt toolkit https://github.com/prompt-toolkit/python-prompt-toolkit/blob/master/prompt_toolkit/keys.py
 
@@ -199,7 +199,6 @@ class Keys(str, Enum):
     ShiftControlEnd = ControlShiftEnd
 
 
-@dataclass
-class Binding:
+class Binding(NamedTuple):
     action: str
     description: str
\ No newline at end of file
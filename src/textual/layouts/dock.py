@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import sys
-from collections import defaultdict
+from collections import deque
 from dataclasses import dataclass
 import logging
-from typing import TYPE_CHECKING, Mapping, Sequence
-
-from rich._ratio import ratio_resolve
+from typing import TYPE_CHECKING, Callable, Mapping, NamedTuple, Sequence
 
+from .._ratio import ratio_resolve
 from ..geometry import Region, Point
 from ..layout import Layout, MapRegion
 from .._types import Lines
@@ -27,8 +26,7 @@ log = logging.getLogger("rich")
 DockEdge = Literal["top", "right", "bottom", "left"]
 
 
-@dataclass
-class DockOptions:
+class DockOptions(NamedTuple):
     size: int | None = None
     fraction: int = 1
     minimum_size: int = 1
@@ -45,115 +43,202 @@ class Dock:
     z: int = 0
 
 
+AddWidget = "Callable[[Widget, int, int, int, int, tuple[int, int]], None]"
+
+
+def _dock_top(
+    widgets: Sequence[Widget],
+    dock_options: list[DockOptions],
+    region: Region,
+    order: tuple[int, int],
+    add_widget: AddWidget,
+) -> Region:
+    x, y, width, height = region
+    sizes = ratio_resolve(height, dock_options)
+    render_y = y
+    remaining = height
+    total = 0
+    for widget, size in zip(widgets, sizes):
+        if not widget.visible:
+            continue
+        size = min(remaining, size)
+        if not size:
+            break
+        total += size
+        add_widget(widget, x, render_y, width, size, order)
+        render_y += size
+        remaining = max(0, remaining - size)
+    return Region(x, y + total, width, height - total)
+
+
+def _dock_bottom(
+    widgets: Sequence[Widget],
+    dock_options: list[DockOptions],
+    region: Region,
+    order: tuple[int, int],
+    add_widget: AddWidget,
+) -> Region:
+    x, y, width, height = region
+    sizes = ratio_resolve(height, dock_options)
+    render_y = y + height
+    remaining = height
+    total = 0
+    for widget, size in zip(widgets, sizes):
+        if not widget.visible:
+            continue
+        size = min(remaining, size)
+        if not size:
+            break
+        total += size
+        add_widget(widget, x, render_y - size, width, size, order)
+        render_y -= size
+        remaining = max(0, remaining - size)
+    return Region(x, y, width, height - total)
+
+
+def _dock_left(
+    widgets: Sequence[Widget],
+    dock_options: list[DockOptions],
+    region: Region,
+    order: tuple[int, int],
+    add_widget: AddWidget,
+) -> Region:
+    x, y, width, height = region
+    sizes = ratio_resolve(width, dock_options)
+    render_x = x
+    remaining = width
+    total = 0
+    for widget, size in zip(widgets, sizes):
+        if not widget.visible:
+            continue
+        size = min(remaining, size)
+        if not size:
+            break
+        total += size
+        add_widget(widget, render_x, y, size, height, order)
+        render_x += size
+        remaining = max(0, remaining - size)
+    return Region(x + total, y, width - total, height)
+
+
+def _dock_right(
+    widgets: Sequence[Widget],
+    dock_options: list[DockOptions],
+    region: Region,
+    order: tuple[int, int],
+    add_widget: AddWidget,
+) -> Region:
+    x, y, width, height = region
+    sizes = ratio_resolve(width, dock_options)
+    render_x = x + width
+    remaining = width
+    total = 0
+    for widget, size in zip(widgets, sizes):
+        if not widget.visible:
+            continue
+        size = min(remaining, size)
+        if not size:
+            break
+        total += size
+        add_widget(widget, render_x - size, y, size, height, order)
+        render_x -= size
+        remaining = max(0, remaining - size)
+    return Region(x, y, width - total, height)
+
+
+_EDGE_DISPATCH: dict[DockEdge, Callable] = {
+    "top": _dock_top,
+    "bottom": _dock_bottom,
+    "left": _dock_left,
+    "right": _dock_right,
+}
+
+
 class DockLayout(Layout):
     def __init__(self, docks: list[Dock] = None) -> None:
         self.docks: list[Dock] = docks or []
+        self._plan: list[tuple[Callable, Sequence[Widget], int, tuple[int, int]]] | None = None
         super().__init__()
 
+    def add_dock(self, dock: Dock) -> None:
+        """Add a dock and invalidate the arrangement plan."""
+        self.docks.append(dock)
+        self._plan = None
+
+    def _get_plan(
+        self,
+    ) -> list[tuple[Callable, Sequence[Widget], int, tuple[int, int]]]:
+        """Get a plan for arranging the docks.
+
+        Docks change rarely (usually on mount only) while generate_map runs on
+        every resize and reflow, so the edge helper lookup and order tuples are
+        evaluated once per dock configuration rather than per pass.
+        """
+        plan = self._plan
+        if plan is None:
+            plan = self._plan = [
+                (_EDGE_DISPATCH[dock.edge], dock.widgets, dock.z, (dock.z, index))
+                for index, dock in enumerate(self.docks)
+            ]
+        return plan
+
     def generate_map(
         self, width: int, height: int, offset: Point = Point(0, 0)
     ) -> dict[Widget, MapRegion]:
-        from ..view import View
-
         map: dict[Widget, MapRegion] = {}
+        # Worklist of (layout, width, height, offset); nested views are
+        # appended here rather than arranged via a recursive call
+        work: deque[tuple[Layout, int, int, Point]] = deque(
+            [(self, width, height, offset)]
+        )
+        while work:
+            layout, width, height, offset = work.popleft()
+            if isinstance(layout, DockLayout):
+                layout._arrange(map, width, height, offset, work)
+            else:
+                map.update(layout.generate_map(width, height, offset))
+        return map
 
-        layout_region = Region(0, 0, width, height)
-        layers: dict[int, Region] = defaultdict(lambda: layout_region)
+    def _arrange(
+        self,
+        map: dict[Widget, MapRegion],
+        width: int,
+        height: int,
+        offset: Point,
+        work: "deque[tuple[Layout, int, int, Point]]",
+    ) -> None:
+        """Arrange this layout's docks, adding regions to a shared map."""
+        from ..view import View
 
-        def add_widget(widget: Widget, region: Region, order: tuple[int, int]):
-            region = region + offset + widget.layout_offset
+        layout_region = Region(0, 0, width, height)
+        layers: dict[int, Region] = {}
+        offset_x, offset_y = offset
+
+        def add_widget(
+            widget: Widget,
+            x: int,
+            y: int,
+            region_width: int,
+            region_height: int,
+            order: tuple[int, int],
+        ):
+            # Fold the layout offset and widget offset in to a single Region
+            layout_offset_x, layout_offset_y = widget.layout_offset
+            region = Region(
+                x + offset_x + layout_offset_x,
+                y + offset_y + layout_offset_y,
+                region_width,
+                region_height,
+            )
             map[widget] = MapRegion(region, order)
             if isinstance(widget, View):
-                sub_map = widget.layout.generate_map(
-                    region.width, region.height, offset=region.origin
-                )
-                map.update(sub_map)
-
-        for index, dock in enumerate(self.docks):
-            dock_options = [
-                DockOptions(
-                    widget.layout_size,
-                    widget.layout_fraction,
-                    widget.layout_minimim_size,
-                )
-                for widget in dock.widgets
-            ]
-            region = layers[dock.z]
+                work.append((widget.layout, region_width, region_height, region.origin))
+
+        for edge_dock, widgets, z, order in self._get_plan():
+            region = layers.get(z, layout_region)
             if not region:
                 # No space left
                 continue
 
-            order = (dock.z, index)
-            x, y, width, height = region
-
-            if dock.edge == "top":
-                sizes = ratio_resolve(height, dock_options)
-                render_y = y
-                remaining = region.height
-                total = 0
-                for widget, size in zip(dock.widgets, sizes):
-                    if not widget.visible:
-                        continue
-                    size = min(remaining, size)
-                    if not size:
-                        break
-                    total += size
-                    add_widget(widget, Region(x, render_y, width, size), order)
-                    render_y += size
-                    remaining = max(0, remaining - size)
-                region = Region(x, y + total, width, height - total)
-
-            elif dock.edge == "bottom":
-                sizes = ratio_resolve(height, dock_options)
-                render_y = y + height
-                remaining = region.height
-                total = 0
-                for widget, size in zip(dock.widgets, sizes):
-                    if not widget.visible:
-                        continue
-                    size = min(remaining, size)
-                    if not size:
-                        break
-                    total += size
-                    add_widget(widget, Region(x, render_y - size, width, size), order)
-                    render_y -= size
-                    remaining = max(0, remaining - size)
-                region = Region(x, y, width, height - total)
-
-            elif dock.edge == "left":
-                sizes = ratio_resolve(width, dock_options)
-                render_x = x
-                remaining = region.width
-                total = 0
-                for widget, size in zip(dock.widgets, sizes):
-                    if not widget.visible:
-                        continue
-                    size = min(remaining, size)
-                    if not size:
-                        break
-                    total += size
-                    add_widget(widget, Region(render_x, y, size, height), order)
-                    render_x += size
-                    remaining = max(0, remaining - size)
-                region = Region(x + total, y, width - total, height)
-
-            elif dock.edge == "right":
-                sizes = ratio_resolve(width, dock_options)
-                render_x = x + width
-                remaining = region.width
-                total = 0
-                for widget, size in zip(dock.widgets, sizes):
-                    if not widget.visible:
-                        continue
-                    size = min(remaining, size)
-                    if not size:
-                        break
-                    total += size
-                    add_widget(widget, Region(render_x - size, y, size, height), order)
-                    render_x -= size
-                    remaining = max(0, remaining - size)
-                region = Region(x, y, width - total, height)
-
-            layers[dock.z] = region
-
-        return map
+            dock_options = [widget.get_dock_options() for widget in widgets]
+            layers[z] = edge_dock(widgets, dock_options, region, order, add_widget)
@@ -203,7 +203,7 @@ class DockView(View):
 
         dock = Dock(edge, widgets, z)
         assert isinstance(self.layout, DockLayout)
-        self.layout.docks.append(dock)
+        self.layout.add_dock(dock)
         for widget in widgets:
             if size is not do_not_set:
                 widget.layout_size = cast(Optional[int], size)
@@ -26,6 +26,7 @@ from ._animator import BoundAnimator
 from ._context import active_app
 from ._loop import loop_last
 from ._line_cache import LineCache
+from .layouts.dock import DockOptions
 from .message import Message
 from .messages import UpdateMessage, LayoutMessage
 from .message_pump import MessagePump
@@ -64,6 +65,7 @@ class Widget(MessagePump):
         self._repaint_required = False
         self._layout_required = False
         self._animate: BoundAnimator | None = None
+        self._dock_options: DockOptions | None = None
 
         super().__init__()
 
@@ -78,6 +80,23 @@ class Widget(MessagePump):
         super().__init_subclass__()
         cls.can_focus = can_focus
 
+    def watch_layout_size(self, layout_size: int | None) -> None:
+        self._dock_options = None
+
+    def watch_layout_fraction(self, layout_fraction: int) -> None:
+        self._dock_options = None
+
+    def watch_layout_minimim_size(self, layout_minimim_size: int) -> None:
+        self._dock_options = None
+
+    def get_dock_options(self) -> DockOptions:
+        """Get (cached) options for docking this widget."""
+        if self._dock_options is None:
+            self._dock_options = DockOptions(
+                self.layout_size, self.layout_fraction, self.layout_minimim_size
+            )
+        return self._dock_options
+
     def __rich_repr__(self) -> rich.repr.RichReprResult:
         yield "name", self.name
 
@@ -1,5 +1,5 @@
-from datetime import datetime
 from logging import getLogger
+from time import localtime
 
 from rich.console import Console, ConsoleOptions, RenderableType
 from rich.panel import Panel
@@ -10,6 +10,7 @@ from rich.text import TextType
 
 from .. import events
 from ..widget import Widget
+from ..reactive import Reactive
 
 log = getLogger("rich")
 
@@ -23,36 +24,57 @@ class Header(Widget):
         style: StyleType = "white on blue",
         clock: bool = True
     ) -> None:
+        super().__init__()
+        self._header: RenderableType | None = None
+        self._header_table: Table | None = None
+        self._last_clock = ""
         self.title = title
         self.panel = panel
         self.style = style
         self.clock = clock
-
-        super().__init__()
         self.layout_size = 3
 
+    title: Reactive[TextType] = Reactive("")
+    style: Reactive[StyleType] = Reactive("white on blue")
+
+    def watch_title(self, title: TextType) -> None:
+        self._header = None
+
+    def watch_style(self, style: StyleType) -> None:
+        self._header = None
+
     def __rich_repr__(self) -> RichReprResult:
         yield self.title
 
     def get_clock(self) -> str:
-        return datetime.now().time().strftime("%X")
+        time = localtime()
+        return f"{time.tm_hour:02d}:{time.tm_min:02d}:{time.tm_sec:02d}"
 
     def render(self) -> RenderableType:
-
-        header_table = Table.grid(padding=(0, 1), expand=True)
-        header_table.style = self.style
-        header_table.add_column(justify="left", ratio=0)
-        header_table.add_column("title", justify="center", ratio=1)
-        if self.clock:
-            header_table.add_column("clock", justify="right")
-            header_table.add_row("🐞", self.title, self.get_clock())
-        else:
-            header_table.add_row("🐞", self.title)
-        header: RenderableType
-        if self.panel:
-            header = Panel(header_table, style=self.style)
-        else:
-            header = header_table
+        header = self._header
+        if header is None:
+            header_table = Table.grid(padding=(0, 1), expand=True)
+            header_table.style = self.style
+            header_table.add_column(justify="left", ratio=0)
+            header_table.add_column("title", justify="center", ratio=1)
+            if self.clock:
+                self._last_clock = self.get_clock()
+                header_table.add_column("clock", justify="right")
+                header_table.add_row("🐞", self.title, self._last_clock)
+            else:
+                header_table.add_row("🐞", self.title)
+            self._header_table = header_table
+            if self.panel:
+                header = Panel(header_table, style=self.style)
+            else:
+                header = header_table
+            self._header = header
+        elif self.clock:
+            # Only the clock cell changes between refreshes
+            clock = self.get_clock()
+            if clock != self._last_clock:
+                self._last_clock = clock
+                self._header_table.columns[2]._cells[0] = clock
         return header
 
     async def on_mount(self, event: events.Mount) -> None:
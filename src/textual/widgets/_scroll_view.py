@@ -60,7 +60,7 @@ class ScrollView(DockView):
     async def on_mouse_scroll_up(self, event: events.MouseScrollUp) -> None:
         self.scroll_up()
 
-    async def on_mouse_scroll_down(self, event: events.MouseScrollUp) -> None:
+    async def on_mouse_scroll_down(self, event: events.MouseScrollDown) -> None:
         self.scroll_down()
 
     def scroll_up(self) -> None: